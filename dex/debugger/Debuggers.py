@@ -22,7 +22,7 @@
 # THE SOFTWARE.
 """Discover potential/available debugger interfaces."""
 
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import os
 import pickle
 import subprocess
@@ -77,8 +77,7 @@ def add_debugger_tool_base_arguments(parser, defaults):
 
 
 def add_debugger_tool_arguments(parser, context, defaults):
-    debuggers = Debuggers(context)
-    potential_debuggers = sorted(debuggers.potential_debuggers().keys())
+    potential_debuggers = Debuggers.sorted_potential_debuggers()
 
     add_debugger_tool_base_arguments(parser, defaults)
 
@@ -100,6 +99,12 @@ def add_debugger_tool_arguments(parser, context, defaults):
         type=float,
         default=0.0,
         help='number of seconds to pause between steps')
+    parser.add_argument(
+        '--no-debugger-subprocess',
+        action='store_true',
+        default=False,
+        help='run the debugger in this process rather than in a sandboxed '
+             'subprocess (faster, but a debugger crash brings down dexter)')
     defaults.show_debugger = False
     parser.add_argument(
         '--show-debugger',
@@ -151,13 +156,10 @@ def handle_debugger_tool_options(context, defaults):  # noqa
 
 def _get_command_infos(context):
     commands = find_all_commands(context.options.source_files)
-    command_infos = OrderedDict()
-    for command_type in commands:
-        for command in commands[command_type].values():
-            if command_type not in command_infos:
-                command_infos[command_type] = []
-            command_infos[command_type].append(command)
-    return OrderedDict(command_infos)
+    return {
+        command_type: list(commands[command_type].values())
+        for command_type in commands
+    }
 
 
 def empty_debugger_steps(context):
@@ -167,6 +169,35 @@ def empty_debugger_steps(context):
         dexter_version=context.version)
 
 
+def run_debugger_internal(context, step_collection):
+    """Run the debugger over a test, recording the steps it takes into
+    step_collection.
+
+    Raises:
+        DebuggerException: if the debugger could not be loaded or fails
+        while running.
+    """
+    options = context.options
+
+    with Timer('loading debugger'):
+        debugger = Debuggers(context).load(options.debugger, step_collection)
+        step_collection.debugger = debugger.debugger_info
+
+    with Timer('running debugger'):
+        if not debugger.is_available:
+            msg = '<d>could not load {}</> ({})\n'.format(
+                debugger.name, debugger.loading_error)
+            if options.verbose:
+                msg = '{}\n    {}'.format(
+                    msg, '    '.join(debugger.loading_error_trace))
+            raise DebuggerException(msg)
+
+        with debugger:
+            debugger.start()
+
+    return step_collection
+
+
 def get_debugger_steps(context):
     step_collection = empty_debugger_steps(context)
 
@@ -178,32 +209,37 @@ def get_debugger_steps(context):
                 e.filename, e.lineno, e.info, e.src, e.caret)
             raise DebuggerException(msg)
 
+    if context.options.no_debugger_subprocess:
+        return run_debugger_internal(context, step_collection)
+
     with NamedTemporaryFile(
             dir=context.working_directory.path, delete=False) as fp:
         pickle.dump(step_collection, fp, protocol=pickle.HIGHEST_PROTOCOL)
         steps_path = fp.name
 
-    with NamedTemporaryFile(
-            dir=context.working_directory.path, delete=False, mode='wb') as fp:
-        pickle.dump(context.options, fp, protocol=pickle.HIGHEST_PROTOCOL)
-        options_path = fp.name
-
     dexter_py = sys.argv[0]
     if not os.path.isfile(dexter_py):
         dexter_py = os.path.join(get_root_directory(), '..', dexter_py)
     assert os.path.isfile(dexter_py)
 
-    with NamedTemporaryFile(dir=context.working_directory.path) as fp:
-        args = [
-            sys.executable, dexter_py, 'run-debugger-internal-', steps_path,
-            options_path, '--working-directory', context.working_directory.path,
-            '--unittest=off', '--indent-timer-level={}'.format(Timer.indent + 2)
-        ]
-        try:
-            with Timer('running external debugger process'):
-                subprocess.check_call(args)
-        except subprocess.CalledProcessError as e:
-            raise DebuggerException(e)
+    args = [
+        sys.executable, dexter_py, 'run-debugger-internal-', steps_path,
+        '--working-directory', context.working_directory.path,
+        '--unittest=off', '--indent-timer-level={}'.format(Timer.indent + 2)
+    ]
+    try:
+        with Timer('running external debugger process'):
+            # The options travel over the child's stdin rather than through
+            # a tempfile. Nothing in the child cares about our descriptors,
+            # so skip the per-fd close pass the default close_fds=True does.
+            subprocess.run(
+                args,
+                input=pickle.dumps(
+                    context.options, protocol=pickle.HIGHEST_PROTOCOL),
+                check=True,
+                close_fds=False)
+    except subprocess.CalledProcessError as e:
+        raise DebuggerException(e)
 
     with open(steps_path, 'rb') as fp:
         step_collection = pickle.load(fp)
@@ -220,6 +256,15 @@ class Debuggers(object):
             cls._potential_debuggers = _get_potential_debuggers()
             return cls._potential_debuggers
 
+    @classmethod
+    def sorted_potential_debuggers(cls):
+        try:
+            return cls._sorted_potential_debuggers
+        except AttributeError:
+            cls._sorted_potential_debuggers = tuple(
+                sorted(cls.potential_debuggers()))
+            return cls._sorted_potential_debuggers
+
     def __init__(self, context):
         self.context = context
 
@@ -228,35 +273,49 @@ class Debuggers(object):
             return Debuggers.potential_debuggers()[key](self.context,
                                                         step_collection)
 
+    def _load_debugger_info(self, key):
+        debugger = self.load(key)
+
+        class LoadedDebugger(object):
+            pass
+
+        LoadedDebugger.option_name = key
+        LoadedDebugger.full_name = '[{}]'.format(debugger.name)
+        LoadedDebugger.is_available = debugger.is_available
+
+        if LoadedDebugger.is_available:
+            try:
+                LoadedDebugger.version = debugger.version.splitlines()
+            except AttributeError:
+                LoadedDebugger.version = ['']
+        else:
+            try:
+                LoadedDebugger.error = debugger.loading_error.splitlines()
+            except AttributeError:
+                LoadedDebugger.error = ['']
+
+            try:
+                LoadedDebugger.error_trace = debugger.loading_error_trace
+            except AttributeError:
+                LoadedDebugger.error_trace = None
+
+        return LoadedDebugger
+
     def _populate_debugger_cache(self):
-        debuggers = []
-        for key in sorted(Debuggers.potential_debuggers()):
-            debugger = self.load(key)
-
-            class LoadedDebugger(object):
-                pass
-
-            LoadedDebugger.option_name = key
-            LoadedDebugger.full_name = '[{}]'.format(debugger.name)
-            LoadedDebugger.is_available = debugger.is_available
-
-            if LoadedDebugger.is_available:
-                try:
-                    LoadedDebugger.version = debugger.version.splitlines()
-                except AttributeError:
-                    LoadedDebugger.version = ['']
-            else:
-                try:
-                    LoadedDebugger.error = debugger.loading_error.splitlines()
-                except AttributeError:
-                    LoadedDebugger.error = ['']
+        try:
+            return Debuggers._debugger_cache
+        except AttributeError:
+            pass
 
-                try:
-                    LoadedDebugger.error_trace = debugger.loading_error_trace
-                except AttributeError:
-                    LoadedDebugger.error_trace = None
+        keys = Debuggers.sorted_potential_debuggers()
 
-            debuggers.append(LoadedDebugger)
+        # Probing a debugger's availability and version can launch external
+        # processes, so probe them all concurrently rather than serializing
+        # the launch latencies.
+        with ThreadPoolExecutor(max_workers=len(keys)) as executor:
+            debuggers = list(executor.map(self._load_debugger_info, keys))
+
+        Debuggers._debugger_cache = debuggers
         return debuggers
 
     def list(self):
@@ -268,13 +327,9 @@ class Debuggers(object):
         msgs = []
 
         for d in debuggers:
-            # Option name, right padded with spaces for alignment
-            option_name = (
-                '{{name: <{}}}'.format(max_o_len).format(name=d.option_name))
-
-            # Full name, right padded with spaces for alignment
-            full_name = ('{{name: <{}}}'.format(max_n_len)
-                         .format(name=d.full_name))
+            # Option and full names, right padded with spaces for alignment.
+            option_name = d.option_name.ljust(max_o_len)
+            full_name = d.full_name.ljust(max_n_len)
 
             if d.is_available:
                 name = '<b>{} {}</>'.format(option_name, full_name)
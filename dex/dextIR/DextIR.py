@@ -20,7 +20,6 @@
 # LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
-from collections import OrderedDict
 from typing import List
 
 from dex.dextIR.BuilderIR import BuilderIR
@@ -28,8 +27,8 @@ from dex.dextIR.DebuggerIR import DebuggerIR
 from dex.dextIR.StepIR import StepIR, StepKind
 
 
-def _step_kind_func(context, step):
-    if step.current_location.path in context.options.source_files:
+def _step_kind_func(source_paths, step):
+    if step.current_location.path in source_paths:
         return StepKind.FUNC
 
     if step.current_location.path is None:
@@ -52,16 +51,21 @@ class DextIR:
         commands: { name (str), commands (list[CommandIR])
     """
 
+    __slots__ = ('dexter_version', 'executable_path', 'source_paths',
+                 '_source_paths_set', 'builder', 'debugger', 'commands',
+                 'steps')
+
     def __init__(self,
                  dexter_version: str,
                  executable_path: str,
                  source_paths: List[str],
                  builder: BuilderIR = None,
                  debugger: DebuggerIR = None,
-                 commands: OrderedDict = None):
+                 commands: dict = None):
         self.dexter_version = dexter_version
         self.executable_path = executable_path
         self.source_paths = source_paths
+        self._source_paths_set = frozenset(source_paths)
         self.builder = builder
         self.debugger = debugger
         self.commands = commands
@@ -69,7 +73,7 @@ class DextIR:
 
     def __str__(self):
         colors = 'rgby'
-        st = '## BEGIN ##\n'
+        lines = ['## BEGIN ##']
         color_idx = 0
         for step in self.steps:
             if step.step_kind in (StepKind.FUNC, StepKind.FUNC_EXTERNAL,
@@ -77,10 +81,10 @@ class DextIR:
                 color_idx += 1
 
             color = colors[color_idx % len(colors)]
-            st += '<{}>{}</>\n'.format(color, step)
-        st += '## END ({} step{}) ##\n'.format(
-            self.num_steps, '' if self.num_steps == 1 else 's')
-        return st
+            lines.append('<{}>{}</>'.format(color, step))
+        lines.append('## END ({} step{}) ##\n'.format(
+            self.num_steps, '' if self.num_steps == 1 else 's'))
+        return '\n'.join(lines)
 
     @property
     def num_steps(self):
@@ -101,7 +105,7 @@ class DextIR:
             return StepKind.UNKNOWN
 
         if len(self.steps) == 0:
-            return _step_kind_func(context, step)
+            return _step_kind_func(self._source_paths_set, step)
 
         prev_step = self.steps[-1]
 
@@ -109,24 +113,29 @@ class DextIR:
             return StepKind.UNKNOWN
 
         if prev_step.num_frames < step.num_frames:
-            return _step_kind_func(context, step)
+            return _step_kind_func(self._source_paths_set, step)
 
         if prev_step.num_frames > step.num_frames:
             frame_step = self._get_prev_step_in_this_frame(step)
             prev_step = frame_step if frame_step is not None else prev_step
 
+        # current_location walks the frame list each time it is evaluated,
+        # so grab each location once for the comparisons below.
+        prev_loc = prev_step.current_location
+        loc = step.current_location
+
         # We're in the same func as prev step, check lineo.
-        if prev_step.current_location.lineno > step.current_location.lineno:
+        if prev_loc.lineno > loc.lineno:
             return StepKind.VERTICAL_BACKWARD
 
-        if prev_step.current_location.lineno < step.current_location.lineno:
+        if prev_loc.lineno < loc.lineno:
             return StepKind.VERTICAL_FORWARD
 
         # We're on the same line as prev step, check column.
-        if prev_step.current_location.column > step.current_location.column:
+        if prev_loc.column > loc.column:
             return StepKind.HORIZONTAL_BACKWARD
 
-        if prev_step.current_location.column < step.current_location.column:
+        if prev_loc.column < loc.column:
             return StepKind.HORIZONTAL_FORWARD
 
         # This step is in exactly the same location as the prev step.
@@ -138,5 +147,20 @@ class DextIR:
         self.steps.append(step)
         return step
 
+    def extend_steps(self, context, steps):
+        """Classify and record a batch of steps in one pass.
+
+        Equivalent to calling new_step for each element of steps, but with
+        the per-call lookups hoisted out of the loop; use this when a
+        debugger produces steps in bursts.
+        """
+        append = self.steps.append
+        get_kind = self._get_new_step_kind
+        for step in steps:
+            assert isinstance(step, StepIR), type(step)
+            step.step_kind = get_kind(context, step)
+            append(step)
+        return steps
+
     def clear_steps(self):
         self.steps.clear()
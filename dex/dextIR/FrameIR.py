@@ -26,6 +26,8 @@ from dex.dextIR.LocIR import LocIR
 class FrameIR:
     """Data class which represents a frame in the call stack"""
 
+    __slots__ = ('function', 'is_inlined', 'loc')
+
     def __init__(self, function: str, is_inlined: bool, loc: LocIR):
         self.function = function
         self.is_inlined = is_inlined
@@ -26,6 +26,8 @@ import os
 class LocIR:
     """Data class which represents a source location."""
 
+    __slots__ = ('path', 'lineno', 'column')
+
     def __init__(self, path: str, lineno: int, column: int):
         if path:
             path = os.path.normcase(path)
@@ -59,6 +59,9 @@ class StepIR:
         watches (OrderedDict): { expression (str), result (ValueIR) }
     """
 
+    __slots__ = ('step_index', 'step_kind', 'stop_reason', 'program_state',
+                 'frames', 'watches')
+
     def __init__(self,
                  step_index: int,
                  stop_reason: StopReason,
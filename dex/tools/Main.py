@@ -26,7 +26,7 @@ parsing and running the unit-testing harnesses, before calling the reequested
 subtool.
 """
 
-import imp
+import importlib
 import os
 import sys
 
@@ -142,10 +142,10 @@ def _import_tool_module(tool_name):
     # format tool argument to reflect tool directory form.
     tool_name = tool_name.replace('-', '_')
 
-    tools_directory = get_tools_directory()
-    module_info = imp.find_module(tool_name, [tools_directory])
+    tool_path = os.path.join(get_tools_directory(), tool_name)
+    assert os.path.isdir(tool_path), tool_path
 
-    return imp.load_module(tool_name, *module_info)
+    return importlib.import_module('dex.tools.{}'.format(tool_name))
 
 
 def tool_main(context, tool, args):
@@ -112,10 +112,17 @@ class TestToolBase(ToolBase):
     def go(self) -> ReturnCode:  # noqa
         options = self.context.options
 
-        subdirs = sorted([
-            r for r, _, f in os.walk(options.tests_directory)
-            if 'test.cfg' in f
-        ])
+        subdirs = []
+        for root, dirs, files in os.walk(options.tests_directory):
+            # Prune directories that cannot contain tests so the walk
+            # doesn't descend into them.
+            dirs[:] = [
+                d for d in dirs
+                if d != '__pycache__' and not d.startswith('.')
+            ]
+            if 'test.cfg' in files:
+                subdirs.append(root)
+        subdirs.sort()
 
         for subdir in subdirs:
 
@@ -26,8 +26,9 @@ not bring down the entire DExTer tool.
 """
 
 import pickle
+import sys
 
-from dex.debugger import Debuggers
+from dex.debugger.Debuggers import run_debugger_internal
 from dex.tools import ToolBase
 from dex.utils import Timer
 from dex.utils.Exceptions import DebuggerException, Error
@@ -45,46 +46,27 @@ class Tool(ToolBase):
 
     def add_tool_arguments(self, parser, defaults):
         parser.add_argument('dextIR_path', type=str, help='dextIR file')
-        parser.add_argument(
-            'pickled_options', type=str, help='pickled options file')
 
     def handle_options(self, defaults):
         with open(self.context.options.dextIR_path, 'rb') as fp:
             self.dextIR = pickle.load(fp)
 
-        with open(self.context.options.pickled_options, 'rb') as fp:
-            poptions = pickle.load(fp)
-            poptions.working_directory = (
-                self.context.options.working_directory[:])
-            poptions.unittest = self.context.options.unittest
-            poptions.dextIR_path = self.context.options.dextIR_path
-            self.context.options = poptions
+        # The parent process streams our pickled options over stdin.
+        poptions = pickle.load(sys.stdin.buffer)
+        poptions.working_directory = (
+            self.context.options.working_directory[:])
+        poptions.unittest = self.context.options.unittest
+        poptions.dextIR_path = self.context.options.dextIR_path
+        self.context.options = poptions
 
         Timer.display = self.context.options.time_report
 
     def go(self) -> ReturnCode:
-        options = self.context.options
-
-        with Timer('loading debugger'):
-            debugger = Debuggers(self.context).load(options.debugger,
-                                                    self.dextIR)
-            self.dextIR.debugger = debugger.debugger_info
-
-        with Timer('running debugger'):
-            if not debugger.is_available:
-                msg = '<d>could not load {}</> ({})\n'.format(
-                    debugger.name, debugger.loading_error)
-                if options.verbose:
-                    msg = '{}\n    {}'.format(
-                        msg, '    '.join(debugger.loading_error_trace))
-                raise Error(msg)
-
-            with debugger:
-                try:
-                    debugger.start()
-                except DebuggerException as e:
-                    raise Error(e)
+        try:
+            run_debugger_internal(self.context, self.dextIR)
+        except DebuggerException as e:
+            raise Error(e)
 
         with open(self.context.options.dextIR_path, 'wb') as fp:
-            pickle.dump(self.dextIR, fp)
+            pickle.dump(self.dextIR, fp, protocol=pickle.HIGHEST_PROTOCOL)
         return ReturnCode.OK